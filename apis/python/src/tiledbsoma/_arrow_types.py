@@ -294,6 +294,7 @@ def df_to_arrow(df: pd.DataFrame) -> pa.Table:
     # later on. This means that on fresh ingest we must use a larger bit-width than
     # the bare minimum necessary.
     new_map = {}
+    widened = False
     for field in arrow_table.schema:
         if pa.types.is_dictionary(field.type):
             old_index_type = field.type.index_type
@@ -302,6 +303,7 @@ def df_to_arrow(df: pd.DataFrame) -> pa.Table:
                 if old_index_type in [pa.int8(), pa.int16()]
                 else old_index_type
             )
+            widened = widened or new_index_type != old_index_type
             new_map[field.name] = pa.dictionary(
                 new_index_type,
                 field.type.value_type,
@@ -309,9 +311,13 @@ def df_to_arrow(df: pd.DataFrame) -> pa.Table:
             )
         else:
             new_map[field.name] = field.type
-    new_schema = pa.schema(new_map, metadata=arrow_table.schema.metadata)
 
-    arrow_table = pa.Table.from_pandas(df, schema=new_schema)
+    if widened:
+        # Cast the Arrow table we already have, rather than converting the
+        # whole dataframe from pandas a second time: only the dictionary
+        # indices change, and all other columns are carried over as-is.
+        new_schema = pa.schema(new_map, metadata=arrow_table.schema.metadata)
+        arrow_table = arrow_table.cast(new_schema)
 
     return arrow_table
 
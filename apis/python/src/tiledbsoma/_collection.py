@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import itertools
 import re
+import threading
 from typing import (
     Any,
     Callable,
@@ -82,7 +83,7 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
     :class:`DataFrame`, :class:`DenseNDArray`, :class:`SparseNDArray` or :class:`Experiment`.
     """
 
-    __slots__ = ("_contents", "_mutated_keys")
+    __slots__ = ("_contents", "_mutated_keys", "_open_lock")
     _wrapper_type = _tdb_handles.GroupWrapper
     _reader_wrapper_type = _tdb_handles.GroupWrapper
 
@@ -190,6 +191,12 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
         This is loaded at startup when we have a read handle.
         """
         self._mutated_keys: Set[str] = set()
+        self._open_lock = threading.Lock()
+        """Guards publication of lazily-opened members in ``__getitem__``.
+
+        Members are opened outside the lock, so concurrent access to
+        different members of the same collection does not serialize on I/O.
+        """
 
     # Overloads to allow type inference to work when doing:
     #
@@ -459,6 +466,10 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
         """Return the number of members in the collection"""
         return len(self._contents)
 
+    def __contains__(self, key: object) -> bool:
+        """Checks membership without opening the member, as ``__getitem__`` would."""
+        return key in self._contents
+
     def __getitem__(self, key: str) -> CollectionElementType:
         """Gets the value associated with the key."""
         err_str = f"{self.__class__.__name__} has no item {key!r}"
@@ -477,10 +488,21 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
 
             clib_type = entry.entry.wrapper_type.clib_type
             wrapper = _tdb_handles.open(uri, mode, context, timestamp, clib_type)
-            entry.soma = _factory.reify_handle(wrapper)
-
-            # Since we just opened this object, we own it and should close it.
-            self._close_stack.enter_context(entry.soma)
+            soma = _factory.reify_handle(wrapper)
+
+            with self._open_lock:
+                # Re-read the entry: another thread may have published this
+                # member while we were opening it.
+                entry = self._contents[key]
+                if entry.soma is None:
+                    entry.soma = soma
+                    # Since we just opened this object, we own it and should
+                    # close it.
+                    self._close_stack.enter_context(soma)
+                else:
+                    # Another thread opened this member first; discard our
+                    # handle so every caller shares the same object.
+                    soma.close()
         return cast(CollectionElementType, entry.soma)
 
     def set(
@@ -610,7 +632,7 @@ class CollectionBase(  # type: ignore[misc]  # __eq__ false positive
 
         self._check_allows_child(key, type(soma_object))
 
-        if key in self._mutated_keys.union(self._contents):
+        if key in self._mutated_keys or key in self._contents:
             # TileDB groups currently do not support replacing elements.
             # If we use a hack to flush writes, corruption is possible.
             raise SOMAError(f"replacing key {key!r} is unsupported")
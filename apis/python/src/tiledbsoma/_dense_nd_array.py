@@ -273,9 +273,10 @@ class DenseNDArray(NDArray, somacore.DenseNDArray):
             else:
                 new_coords.append(c)
 
-        # Convert data to a numpy array.
+        # Convert data to a numpy array. This is a zero-copy view of the tensor
+        # unless a cast to the array's type is needed.
         dtype = self.schema.field("soma_data").type.to_pandas_dtype()
-        input = np.array(values, dtype=dtype)
+        input = np.asarray(values.to_numpy(), dtype=dtype)
 
         # Set the result order. If neither row nor col major, set to be row major.
         if input.flags.f_contiguous:
@@ -292,15 +292,18 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
         if isinstance(values, pa.SparseCOOTensor):
             # Write bulk data
             data, coords = values.to_numpy()
+            # write_coords hands the raw buffers to C++, so each must be
+            # contiguous and of the schema's type. ascontiguousarray copies only
+            # when a cast or re-layout is actually needed.
             clib_sparse_array.write_coords(
                 [
-                    np.array(
+                    np.ascontiguousarray(
                         c,
                         dtype=self.schema.field(f"soma_dim_{i}").type.to_pandas_dtype(),
                     )
                     for i, c in enumerate(coords.T)
                 ],
-                np.array(
+                np.ascontiguousarray(
                     data, dtype=self.schema.field("soma_data").type.to_pandas_dtype()
                 ),
                 sort_coords or True,
@@ -326,13 +329,13 @@ class SparseNDArray(NDArray, somacore.SparseNDArray):
             sp = values.to_scipy().tocoo()
             clib_sparse_array.write_coords(
                 [
-                    np.array(
+                    np.ascontiguousarray(
                         c,
                         dtype=self.schema.field(f"soma_dim_{i}").type.to_pandas_dtype(),
                     )
                     for i, c in enumerate([sp.row, sp.col])
                 ],
-                np.array(
+                np.ascontiguousarray(
                     sp.data, dtype=self.schema.field("soma_data").type.to_pandas_dtype()
                 ),
                 sort_coords or True,
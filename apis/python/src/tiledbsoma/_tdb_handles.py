@@ -59,6 +59,13 @@ def open(
     clib_type: Optional[str] = None,
 ) -> "Wrapper[RawHandle]":
     """Determine whether the URI is an array or group, and open it."""
+    if clib_type == GroupWrapper.clib_type:
+        # The caller already knows this is a group, and groups are always
+        # handled on the TileDB-Py side. Probing the storage type first (via
+        # the C++ layer, then ``tiledb.object_type``) would open the group
+        # only to throw that handle away, so go straight to the group opener.
+        return GroupWrapper.open(uri, mode, context, timestamp)
+
     open_mode = clib.OpenMode.read if mode == "r" else clib.OpenMode.write
 
     timestamp_ms = context._open_timestamp_ms(timestamp)
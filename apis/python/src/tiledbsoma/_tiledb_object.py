@@ -20,6 +20,9 @@ from ._util import check_type, ms_to_datetime
 from .options import SOMATileDBContext
 from .options._soma_tiledb_context import _validate_soma_tiledb_context
 
+_OPEN_ERRORS = (RuntimeError, SOMAError, tiledb.cc.TileDBError)
+"""Errors raised when opening a URI at which no (readable) object exists."""
+
 _WrapperType_co = TypeVar(
     "_WrapperType_co", bound=_tdb_handles.AnyWrapper, covariant=True
 )
@@ -103,6 +106,9 @@ class TileDBObject(somacore.SOMAObject, Generic[_WrapperType_co]):
             uri, mode, context, tiledb_timestamp, clib_type=clib_type
         )
         if not isinstance(handle, cls._reader_wrapper_type):
+            # Release the probing handle before reopening, rather than leaving
+            # it for the garbage collector to close at some later point.
+            handle.close()
             handle = cls._wrapper_type.open(uri, mode, context, tiledb_timestamp)
         return cls(
             handle,  # type: ignore[arg-type]
@@ -291,12 +297,38 @@ class TileDBObject(somacore.SOMAObject, Generic[_WrapperType_co]):
         context = _validate_soma_tiledb_context(context)
         try:
             with cls._wrapper_type.open(uri, "r", context, tiledb_timestamp) as hdl:
-                md_type = hdl.metadata.get(_constants.SOMA_OBJECT_TYPE_METADATA_KEY)
-                if not isinstance(md_type, str):
-                    return False
-                return md_type.lower() == cls.soma_type.lower()
-        except (RuntimeError, SOMAError, tiledb.cc.TileDBError):
+                return cls._has_soma_type(hdl)
+        except _OPEN_ERRORS:
+            return False
+
+    @classmethod
+    def _open_if_exists(
+        cls,
+        uri: str,
+        context: Optional[SOMATileDBContext] = None,
+        tiledb_timestamp: Optional[OpenTimestamp] = None,
+    ) -> Optional[Self]:
+        """Opens the object for reading if it is of this type, else returns None.
+
+        This gives the same answer as :meth:`exists`, but without opening the
+        object a second time when it does exist.
+        """
+        try:
+            obj = cls.open(uri, "r", context=context, tiledb_timestamp=tiledb_timestamp)
+        except _OPEN_ERRORS:
+            return None
+        if not cls._has_soma_type(obj._handle):
+            obj.close()
+            return None
+        return obj
+
+    @classmethod
+    def _has_soma_type(cls, handle: _tdb_handles.AnyWrapper) -> bool:
+        """Checks whether the handle's SOMA type metadata names this class."""
+        md_type = handle.metadata.get(_constants.SOMA_OBJECT_TYPE_METADATA_KEY)
+        if not isinstance(md_type, str):
             return False
+        return md_type.lower() == cls.soma_type.lower()
 
     @classmethod
     def _set_create_metadata(cls, handle: _tdb_handles.AnyWrapper) -> None:
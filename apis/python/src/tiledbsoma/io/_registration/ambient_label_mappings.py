@@ -40,12 +40,14 @@ class AxisAmbientLabelMapping:
         ``obs`` or ``var`` axis, and a list of input-file 0-up offsets, this returns an int-to-int
         mapping from a single input file's ``obs`` or ``var`` axis to the registered SOMA join IDs.
         """
-        soma_joinids = []
-        for i, input_id in enumerate(input_ids):
-            if input_id not in self.data:
-                raise ValueError(f"input_id {input_id} not found in registration data")
-            soma_joinids.append(self.data[input_id])
-        return AxisIDMapping(data=tuple(soma_joinids))
+        data = self.data
+        try:
+            soma_joinids = tuple([data[input_id] for input_id in input_ids])
+        except KeyError as e:
+            raise ValueError(
+                f"input_id {e.args[0]} not found in registration data"
+            ) from None
+        return AxisIDMapping(data=soma_joinids)
 
     def id_mapping_from_dataframe(self, df: pd.DataFrame) -> AxisIDMapping:
         """Given registered label-to-SOMA-join-ID mappings for all registered input files for an
@@ -73,11 +75,7 @@ class AxisAmbientLabelMapping:
         index_field_name = index_field_name or df.index.name or "index"
         df = df.reset_index()
 
-        data = {}
-        next_soma_joinid = 0
-        for index in df[index_field_name]:
-            data[index] = next_soma_joinid
-            next_soma_joinid += 1
+        data = dict(zip(df[index_field_name], range(len(df))))
         return cls(data=data, field_name=index_field_name)
 
     def to_json(self) -> str:
@@ -228,8 +226,8 @@ class ExperimentAmbientLabelMapping:
 
             with tiledbsoma.Experiment.open(experiment_uri, context=context) as exp:
                 for batch in exp.obs.read(column_names=["soma_joinid", obs_field_name]):
-                    obs_ids = [e.as_py() for e in batch[1]]
-                    soma_joinids = [e.as_py() for e in batch[0]]
+                    obs_ids = batch[1].to_pylist()
+                    soma_joinids = batch[0].to_pylist()
                     obs_map.update(dict(zip(obs_ids, soma_joinids)))
 
                 for measurement_name in exp.ms:
@@ -243,8 +241,8 @@ class ExperimentAmbientLabelMapping:
                     for batch in expvar.read(
                         column_names=["soma_joinid", var_field_name]
                     ):
-                        var_ids = [e.as_py() for e in batch[1]]
-                        soma_joinids = [e.as_py() for e in batch[0]]
+                        var_ids = batch[1].to_pylist()
+                        soma_joinids = batch[0].to_pylist()
                         var_map.update(dict(zip(var_ids, soma_joinids)))
                     var_maps[measurement_name] = var_map
 
@@ -353,11 +351,14 @@ class ExperimentAmbientLabelMapping:
         """Acquires label-to-ID mappings from the baseline, already-written SOMA experiment."""
 
         if experiment_uri is not None:
-            if not tiledbsoma.Experiment.exists(experiment_uri, context=context):
-                raise ValueError("cannot find experiment at URI {experiment_uri}")
+            # Open optimistically, rather than probing with Experiment.exists and
+            # then opening a second time.
+            exp = tiledbsoma.Experiment._open_if_exists(experiment_uri, context=context)
+            if exp is None:
+                raise ValueError(f"cannot find experiment at URI {experiment_uri}")
 
             # Pre-check
-            with tiledbsoma.Experiment.open(experiment_uri, context=context) as exp:
+            with exp:
                 if measurement_name not in exp.ms:
                     raise ValueError(
                         f"cannot append: target measurement {measurement_name} is not in experiment {experiment_uri}"
@@ -6,7 +6,7 @@
 """Conversion utility methods.
 """
 
-from typing import TypeVar, cast
+from typing import Any, Dict, TypeVar, cast
 
 import numpy as np
 import pandas as pd
@@ -22,16 +22,20 @@ _str_to_type = {"boolean": bool, "string": str, "bytes": bytes}
 
 
 def decategoricalize_obs_or_var(obs_or_var: pd.DataFrame) -> pd.DataFrame:
-    """Performs a typecast into types that TileDB can persist."""
-    if len(obs_or_var.columns) > 0:
-        return pd.DataFrame.from_dict(
-            {
-                str(k): to_tiledb_supported_array_type(str(k), v)
-                for k, v in obs_or_var.items()
-            },
-        )
-    else:
-        return obs_or_var.copy()
+    """Performs a typecast into types that TileDB can persist.
+
+    The result is always a new dataframe, since callers modify it in place.
+    Only the columns whose dtypes need changing are cast; the rest are copied
+    over as-is in a single pass, rather than being rebuilt column by column.
+    """
+    casts: Dict[Any, pdt.Dtype] = {}
+    for k, dtype in obs_or_var.dtypes.items():
+        target_dtype = _to_tiledb_supported_dtype(dtype)
+        if target_dtype != dtype:
+            casts[k] = target_dtype
+    df = obs_or_var.astype(casts) if casts else obs_or_var.copy()
+    df.columns = df.columns.map(str)
+    return df
 
 
 @typeguard_ignore
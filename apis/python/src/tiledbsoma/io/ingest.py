@@ -12,6 +12,7 @@ other formats. Currently only ``.h5ad`` (`AnnData <https://anndata.readthedocs.i
 import json
 import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Dict,
@@ -259,6 +260,12 @@ def from_h5ad(
         measurement_name: The name of the measurement to store data in.
 
         context: Optional :class:`SOMATileDBContext` containing storage parameters, etc.
+          For large ingests to object stores, raising the multipart upload size above
+          TileDB's 5 MiB default makes for fewer, larger write requests, e.g.
+          ``SOMATileDBContext(tiledb_config={"vfs.s3.multipart_part_size": 16 * 1024**2})``
+          (or ``vfs.gcs.multi_part_size``, ``vfs.azure.block_list_block_size``). Note that
+          TileDB buffers up to the part size times ``vfs.s3.max_parallel_ops`` per file
+          being written, so write-buffer memory grows in proportion.
 
         platform_config: Platform-specific options used to create this array, provided in the form
           ``{\"tiledb\": {\"create\": {\"sparse_nd_array_dim_zstd_level\": 7}}}``.
@@ -414,6 +421,8 @@ def from_anndata(
     Usage is the same as ``from_h5ad`` except that you can use this function when the AnnData object
     is already loaded into memory.
 
+    See ``from_h5ad`` for suggested ``context`` settings when ingesting to object stores.
+
     Lifecycle:
         Experimental.
     """
@@ -629,7 +638,14 @@ def from_anndata(
                                 coll,
                                 use_relative_uri=use_relative_uri,
                             )
-                            for key in ad_val.keys():
+
+                            # The per-key arrays are independent of one another, so
+                            # they may be created and written concurrently on a
+                            # dedicated executor (never the context's threadpool,
+                            # which the caller may itself be running us on). Group
+                            # membership is then recorded serially, in key order,
+                            # on this thread.
+                            def _ingest_one(key: str) -> SparseNDArray:
                                 val = ad_val[key]
                                 num_cols = val.shape[1]
                                 _axis_1_mapping = (
@@ -651,12 +667,27 @@ def from_anndata(
                                     axis_1_mapping=_axis_1_mapping,
                                     **ingest_ctx,
                                 ) as arr:
-                                    _maybe_set(
-                                        coll,
-                                        key,
-                                        arr,
-                                        use_relative_uri=use_relative_uri,
-                                    )
+                                    return arr
+
+                            keys = list(ad_val.keys())
+                            workers = min(
+                                len(keys),
+                                TileDBCreateOptions.from_platform_config(
+                                    platform_config
+                                ).ingest_array_workers,
+                            )
+                            if workers > 1:
+                                with ThreadPoolExecutor(max_workers=workers) as pool:
+                                    arrs = list(pool.map(_ingest_one, keys))
+                            else:
+                                arrs = [_ingest_one(key) for key in keys]
+                            for key, arr in zip(keys, arrs):
+                                _maybe_set(
+                                    coll,
+                                    key,
+                                    arr,
+                                    use_relative_uri=use_relative_uri,
+                                )
 
                 _ingest_obs_var_m_p("obsm", jidmaps.obs_axis)
                 _ingest_obs_var_m_p("varm", jidmaps.var_axes[measurement_name])
@@ -1332,13 +1363,12 @@ def _create_from_matrix(
         _util.format_elapsed(s, f"START  WRITING {uri}"),
     )
 
+    tiledb_create_options = TileDBCreateOptions.from_platform_config(platform_config)
     if isinstance(soma_ndarray, DenseNDArray):
         _write_matrix_to_denseNDArray(
             soma_ndarray,
             matrix,
-            tiledb_create_options=TileDBCreateOptions.from_platform_config(
-                platform_config
-            ),
+            tiledb_create_options=tiledb_create_options,
             ingestion_params=ingestion_params,
             additional_metadata=additional_metadata,
         )
@@ -1346,9 +1376,7 @@ def _create_from_matrix(
         _write_matrix_to_sparseNDArray(
             soma_ndarray,
             matrix,
-            tiledb_create_options=TileDBCreateOptions.from_platform_config(
-                platform_config
-            ),
+            tiledb_create_options=tiledb_create_options,
             ingestion_params=ingestion_params,
             additional_metadata=additional_metadata,
             axis_0_mapping=axis_0_mapping,
@@ -1357,6 +1385,18 @@ def _create_from_matrix(
     else:
         raise TypeError(f"unknown array type {type(soma_ndarray)}")
 
+    # Chunked writes leave one fragment per chunk. When requested, consolidate
+    # once here, after the whole matrix is written, rather than after each chunk.
+    # The modes are passed explicitly (the binding has no defaults), and include
+    # "fragments" so that the per-chunk fragments are merged into one.
+    if tiledb_create_options.consolidate_and_vacuum:
+        s2 = _util.get_start_stamp()
+        logging.log_io(None, f"START  CONSOLIDATING {uri}")
+        soma_ndarray._handle._handle.consolidate_and_vacuum(
+            ["fragments", "fragment_meta", "commits"]
+        )
+        logging.log_io(None, _util.format_elapsed(s2, f"FINISH CONSOLIDATING {uri}"))
+
     logging.log_io(
         f"Wrote   {uri}",
         _util.format_elapsed(s, f"FINISH WRITING {uri}"),
@@ -1848,10 +1888,12 @@ def _write_matrix_to_denseNDArray(
     nbytes_num_chunks = math.ceil(
         total_nbytes / tiledb_create_options.remote_cap_nbytes
     )
-    nbytes_num_chunks = min(1, nbytes_num_chunks)
+    nbytes_num_chunks = max(1, nbytes_num_chunks)
     chunk_size_using_nbytes = math.floor(nrow / nbytes_num_chunks)
 
-    chunk_size = min(chunk_size_using_nnz, chunk_size_using_nbytes)
+    # A single row can exceed remote_cap_nbytes; always make progress by at least
+    # one row per chunk.
+    chunk_size = max(1, min(chunk_size_using_nnz, chunk_size_using_nbytes))
 
     i = 0
     while i < nrow:
@@ -1970,7 +2012,7 @@ def _find_sparse_chunk_size(
 
 
 def _find_sparse_chunk_size_non_backed(
-    matrix: SparseMatrix,
+    matrix: Union[sp.csr_matrix, sp.csc_matrix],
     start_index: int,
     axis: int,
     goal_chunk_nnz: int,
@@ -1979,22 +2021,33 @@ def _find_sparse_chunk_size_non_backed(
     """Helper routine for ``_find_sparse_chunk_size`` for when we're operating on AnnData
     matrices in non-backed mode. Here, unlike in backed mode, it's performant to exactly
     sum up nnz values from all matrix rows.
+
+    The per-row (or per-column) nnz values are read directly off the compressed
+    representation rather than by slicing the matrix one row at a time: along the
+    matrix's major axis they are the successive differences of ``indptr``, and along
+    its minor axis they are the counts of each value in ``indices``.
     """
-    chunk_size = 0
-    sum_nnz = 0
-    coords: List[Union[slice, int]] = [slice(None), slice(None)]
-    for index in range(start_index, matrix.shape[axis]):
-        coords[axis] = index
-        candidate_sum_nnz = sum_nnz + matrix[tuple(coords)].nnz
-        if candidate_sum_nnz > goal_chunk_nnz:
-            break
-        sum_nnz = candidate_sum_nnz
-        chunk_size += 1
-        # The logger we use doesn't have a TRACE level. If it did, we'd use it here.
-        # logging.logger.trace(
-        #     f"non-backed: index={index} chunk_size={chunk_size} sum_nnz={sum_nnz} goal_nnz={goal_chunk_nnz}"
-        # )
-    return chunk_size
+    extent = matrix.shape[axis]
+    if start_index >= extent:
+        return 0
+    major_axis = 0 if matrix.format == "csr" else 1
+    # In either case, the result is the number of leading rows whose cumulative
+    # nnz stays within the goal.
+    if axis == major_axis:
+        # Search a view of ``indptr`` directly, so that each call is O(log n)
+        # and allocates nothing. The target is summed in Python ints, since
+        # ``indptr`` is often int32 and the sum can exceed its range.
+        indptr = matrix.indptr
+        return int(
+            np.searchsorted(
+                indptr[start_index + 1 :],
+                int(indptr[start_index]) + goal_chunk_nnz,
+                side="right",
+            )
+        )
+    counts = np.bincount(matrix.indices, minlength=extent)
+    cumulative_nnz = np.cumsum(counts[start_index:])
+    return int(np.searchsorted(cumulative_nnz, goal_chunk_nnz, side="right"))
 
 
 def _find_mean_nnz(matrix: Matrix, axis: int) -> int:
@@ -2009,11 +2062,21 @@ def _find_mean_nnz(matrix: Matrix, axis: int) -> int:
         total = nr * nc
         return int(total // matrix.shape[axis])
 
+    # In-memory sparse matrices know their nnz outright.
+    if isinstance(matrix, (sp.csr_matrix, sp.csc_matrix)):  # type: ignore [unreachable]
+        return int(math.ceil(matrix.nnz / extent))
+
+    # For backed (HDF5) sparse matrices, the nnz is the length of the on-disk
+    # data array. That is available from the HDF5 dataset metadata, without
+    # reading any of the matrix contents from the file.
+    if isinstance(matrix, SparseDataset):
+        return int(math.ceil(matrix.group["data"].shape[0] / extent))
+
     # This takes about as long but uses more RAM:
     #   total_nnz = matrix[:, :].nnz
     # So instead we break it up. Testing over a variety of H5AD sizes
     # shows that the performance is fine here.
-    coords: List[slice] = [slice(None), slice(None)]  # type: ignore [unreachable]
+    coords: List[slice] = [slice(None), slice(None)]
     bsz = 1000
     total_nnz = 0
     for lo in range(0, extent, bsz):
@@ -2179,25 +2242,25 @@ def _write_matrix_to_sparseNDArray(
 ) -> None:
     """Write a matrix to an empty DenseNDArray"""
 
+    # Apply registration mappings: e.g. columns 0,1,2,3 in an AnnData file might
+    # have been assigned gene-ID labels 22,197,438,988. The mappings are
+    # materialized as NumPy arrays once, up front, so that each chunk can be
+    # remapped by a single fancy-index rather than a per-element Python loop.
+    axis_0_lookup = np.asarray(axis_0_mapping.data, dtype=np.int64)
+    axis_1_lookup = np.asarray(axis_1_mapping.data, dtype=np.int64)
+
     def _coo_to_table(
         mat_coo: sp.coo_matrix,
-        axis_0_mapping: AxisIDMapping,
-        axis_1_mapping: AxisIDMapping,
         axis: int = 0,
         base: int = 0,
     ) -> pa.Table:
         soma_dim_0 = mat_coo.row + base if base > 0 and axis == 0 else mat_coo.row
         soma_dim_1 = mat_coo.col + base if base > 0 and axis == 1 else mat_coo.col
 
-        # Apply registration mappings: e.g. columns 0,1,2,3 in an AnnData file might
-        # have been assigned gene-ID labels 22,197,438,988.
-        soma_dim_0 = [axis_0_mapping.data[e] for e in soma_dim_0]
-        soma_dim_1 = [axis_1_mapping.data[e] for e in soma_dim_1]
-
         pydict = {
             "soma_data": mat_coo.data,
-            "soma_dim_0": soma_dim_0,
-            "soma_dim_1": soma_dim_1,
+            "soma_dim_0": axis_0_lookup[soma_dim_0],
+            "soma_dim_1": axis_1_lookup[soma_dim_1],
         }
 
         return pa.Table.from_pydict(pydict)
@@ -2232,9 +2295,7 @@ def _write_matrix_to_sparseNDArray(
 
     # Write all at once?
     if not tiledb_create_options.write_X_chunked:
-        soma_ndarray.write(
-            _coo_to_table(sp.coo_matrix(matrix), axis_0_mapping, axis_1_mapping)
-        )
+        soma_ndarray.write(_coo_to_table(sp.coo_matrix(matrix)))
         return
 
     # Or, write in chunks, striding across the most efficient slice axis
@@ -2380,9 +2441,7 @@ def _write_matrix_to_sparseNDArray(
             ),
         )
 
-        arrow_table = _coo_to_table(
-            chunk_coo, axis_0_mapping, axis_1_mapping, stride_axis, i
-        )
+        arrow_table = _coo_to_table(chunk_coo, stride_axis, i)
         _write_arrow_table(arrow_table, soma_ndarray, tiledb_create_options)
 
         t2 = time.time()
@@ -2660,6 +2719,16 @@ def _ingest_uns_string_array(
     )
 
 
+def _uns_string_column(value: NPNDArray) -> List[str]:
+    """Helper for the ``uns`` string-array ingestors: converts a 1D array to a list of
+    Python strings, with falsy entries (e.g. ``None``) becoming empty strings."""
+    if value.dtype.char == "U":
+        # Fixed-width unicode arrays hold only strings, for which the conversion
+        # below is the identity; let NumPy do it in one pass.
+        return cast(List[str], value.tolist())
+    return [str(e) if e else "" for e in value]
+
+
 def _ingest_uns_1d_string_array(
     coll: AnyTileDBCollection,
     key: str,
@@ -2681,7 +2750,7 @@ def _ingest_uns_1d_string_array(
     df = pd.DataFrame(
         data={
             SOMA_JOINID: np.arange(n, dtype=np.int64),
-            _UNS_OUTGEST_COLUMN_NAME_1D: [str(e) if e else "" for e in value],
+            _UNS_OUTGEST_COLUMN_NAME_1D: _uns_string_column(value),
         }
     )
     df.set_index("soma_joinid", inplace=True)
@@ -2727,7 +2796,7 @@ def _ingest_uns_2d_string_array(
     # 1           d        e        f
     for j in range(num_cols):
         column_name = f"values_{j}"
-        data[column_name] = [str(e) if e else "" for e in value[:, j]]
+        data[column_name] = _uns_string_column(value[:, j])
     df = pd.DataFrame(data=data)
     df.set_index("soma_joinid", inplace=True)
 
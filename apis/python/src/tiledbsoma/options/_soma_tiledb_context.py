@@ -41,6 +41,12 @@ def _default_global_ctx() -> tiledb.Ctx:
     return tiledb.Ctx(_default_config({}))
 
 
+@functools.lru_cache(maxsize=None)
+def _default_global_native_context() -> clib.SOMAContext:
+    """Lazily builds a default C++ SOMAContext with the default config."""
+    return clib.SOMAContext({k: str(v) for k, v in _default_config({}).items()})
+
+
 def _maybe_timestamp_ms(input: Optional[OpenTimestamp]) -> Optional[int]:
     if input is None:
         return None
@@ -166,10 +172,18 @@ class SOMATileDBContext(ContextBase):
         """The C++ SOMAContext for this SOMA context."""
         with self._lock:
             if self._native_context is None:
-                cfg = self._internal_tiledb_config()
-                self._native_context = clib.SOMAContext(
-                    {k: str(v) for k, v in cfg.items()}
-                )
+                if self._initial_config is None and (
+                    self._tiledb_ctx is None
+                    or self._tiledb_ctx is _default_global_ctx()
+                ):
+                    # Special case: like the TileDB-Py Context, share the One
+                    # Global Default rather than building a new one each time.
+                    self._native_context = _default_global_native_context()
+                else:
+                    cfg = self._internal_tiledb_config()
+                    self._native_context = clib.SOMAContext(
+                        {k: str(v) for k, v in cfg.items()}
+                    )
             return self._native_context
 
     @property
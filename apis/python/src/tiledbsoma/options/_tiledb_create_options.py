@@ -157,6 +157,11 @@ class TileDBCreateOptions:
     consolidate_and_vacuum: bool = attrs_.field(
         validator=vld.instance_of(bool), default=False
     )
+    # Number of obsm/varm/obsp/varp arrays ingested concurrently. Each in-flight
+    # array can hold up to ``goal_chunk_nnz`` values in memory at a time.
+    ingest_array_workers: int = attrs_.field(
+        validator=[vld.instance_of(int), vld.ge(1)], default=1
+    )
 
     @classmethod
     def from_platform_config(
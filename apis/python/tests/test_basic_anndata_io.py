@@ -100,6 +100,9 @@ def test_import_anndata(conftest_pbmc_small, ingest_modes, X_kind):
     metakey = _constants.SOMA_OBJECT_TYPE_METADATA_KEY  # keystroke-saver
     all2d = (slice(None), slice(None))  # keystroke-saver
 
+    # One context for all the ingests and opens below, rather than a fresh one per call.
+    context = tiledbsoma.SOMATileDBContext()
+
     for ingest_mode in ingest_modes:
         uri = tiledbsoma.io.from_anndata(
             output_path,
@@ -107,13 +110,14 @@ def test_import_anndata(conftest_pbmc_small, ingest_modes, X_kind):
             "RNA",
             ingest_mode=ingest_mode,
             X_kind=X_kind,
+            context=context,
         )
         if ingest_mode != "schema_only":
             have_ingested = True
 
         verify_obs_and_var_eq(original, conftest_pbmc_small)
 
-        exp = tiledbsoma.Experiment.open(uri)
+        exp = tiledbsoma.Experiment.open(uri, context=context)
 
         assert exp.metadata[metakey] == "SOMAExperiment"
 
@@ -124,7 +128,10 @@ def test_import_anndata(conftest_pbmc_small, ingest_modes, X_kind):
         )
         assert exp.obs.metadata.get(metakey) == "SOMADataFrame"
         if have_ingested:
-            assert sorted(obs["obs_id"]) == sorted(list(orig.obs_names))
+            assert np.array_equal(
+                np.sort(obs["obs_id"].to_numpy()),
+                np.sort(orig.obs_names.to_numpy()),
+            )
         else:
             assert sorted(obs["obs_id"]) == []
         # Convenience accessor
@@ -147,7 +154,10 @@ def test_import_anndata(conftest_pbmc_small, ingest_modes, X_kind):
         )
         assert exp.ms["RNA"].var.metadata.get(metakey) == "SOMADataFrame"
         if have_ingested:
-            assert sorted(var["var_id"]) == sorted(list(orig.var_names))
+            assert np.array_equal(
+                np.sort(var["var_id"].to_numpy()),
+                np.sort(orig.var_names.to_numpy()),
+            )
         else:
             assert sorted(var["var_id"]) == []
         # Convenience accessor
@@ -228,6 +238,7 @@ def test_import_anndata(conftest_pbmc_small, ingest_modes, X_kind):
 
         # pbmc-small has no varp
 
+        exp.close()
         tempdir.cleanup()
 
 
@@ -1174,6 +1185,27 @@ def test_obsm_data_type(conftest_pbmc_small):
     assert not any(Path(soma_path).iterdir())
 
 
+@pytest.mark.parametrize("ingest_array_workers", [1, 4])
+def test_ingest_array_workers(conftest_pbmc_small, tmp_path, ingest_array_workers):
+    uri = tmp_path.as_posix()
+    platform_config = {
+        "tiledb": {"create": {"ingest_array_workers": ingest_array_workers}}
+    }
+    tiledbsoma.io.from_anndata(
+        uri, conftest_pbmc_small, "RNA", platform_config=platform_config
+    )
+
+    with tiledbsoma.Experiment.open(uri) as exp:
+        assert sorted(exp.ms["RNA"].obsm.keys()) == sorted(
+            conftest_pbmc_small.obsm.keys()
+        )
+        bdata = tiledbsoma.io.to_anndata(exp, "RNA")
+    for key, orig_value in conftest_pbmc_small.obsm.items():
+        assert np.allclose(bdata.obsm[key], orig_value)
+    for key, orig_value in conftest_pbmc_small.obsp.items():
+        assert (bdata.obsp[key] != orig_value).nnz == 0
+
+
 def test_outgest_X_layers(tmp_path):
     nobs = 200
     nvar = 100
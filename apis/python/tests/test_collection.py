@@ -1,6 +1,7 @@
 import os
 import pathlib
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, TypeVar, Union
 
 import numpy as np
@@ -152,6 +153,29 @@ def test_collection_mapping(soma_object, tmp_path):
         assert not c.get("mumble", False)
 
 
+def test_contains_does_not_open_member(soma_object, tmp_path):
+    uri = tmp_path.as_uri()
+    with soma.Collection.create(uri) as create:
+        create["member"] = soma_object
+
+    with soma.Collection.open(uri) as c:
+        assert "member" in c
+        assert "nonesuch" not in c
+        assert c._contents["member"].soma is None
+
+
+def test_concurrent_getitem(soma_object, tmp_path):
+    uri = tmp_path.as_uri()
+    with soma.Collection.create(uri) as create:
+        create["member"] = soma_object
+
+    with soma.Collection.open(uri) as c, ThreadPoolExecutor(8) as pool:
+        members = list(pool.map(lambda _: c["member"], range(8)))
+        assert all(m is members[0] for m in members)
+        assert not members[0].closed
+    assert members[0].closed
+
+
 def test_delete_add(soma_object, tmp_path: pathlib.Path):
     tmp_uri = tmp_path.as_uri()
     with soma.Collection.create(tmp_uri) as create:
@@ -11,6 +11,7 @@ import tiledb
 @pytest.fixture(autouse=True)
 def global_ctx_reset():
     stc._default_global_ctx.cache_clear()
+    stc._default_global_native_context.cache_clear()
     yield
 
 
@@ -60,6 +61,16 @@ def test_shared_ctx():
     assert ctx.tiledb_ctx is ctx_2.tiledb_ctx
 
 
+def test_shared_native_context():
+    """Verifies that one global native context is shared by default."""
+    ctx = stc.SOMATileDBContext()
+    ctx_2 = stc.SOMATileDBContext()
+    assert ctx.native_context is ctx_2.native_context
+
+    custom = stc.SOMATileDBContext(tiledb_config={"vfs.s3.region": "us-east-2"})
+    assert custom.native_context is not ctx.native_context
+
+
 def test_unshared_ctx():
     """Verifies that contexts are not shared when not appropriate."""
     ctx = stc.SOMATileDBContext()
@@ -1,3 +1,5 @@
+import types
+
 import anndata as ad
 import numpy as np
 import pyarrow as pa
@@ -7,7 +9,9 @@ from scipy import sparse as sp
 import tiledbsoma as soma
 import tiledbsoma.io as somaio
 from tiledbsoma import _factory
+from tiledbsoma.io import ingest
 from tiledbsoma.options._tiledb_create_options import TileDBCreateOptions
+import tiledb
 
 
 @pytest.fixture
@@ -31,6 +35,9 @@ def src_matrix(request):
         TileDBCreateOptions(write_X_chunked=True, goal_chunk_nnz=10000),
         TileDBCreateOptions(write_X_chunked=True, goal_chunk_nnz=100000),
         TileDBCreateOptions(write_X_chunked=True, remote_cap_nbytes=100000),
+        TileDBCreateOptions(
+            write_X_chunked=True, goal_chunk_nnz=10000, consolidate_and_vacuum=True
+        ),
     ],
 )
 @pytest.mark.parametrize(
@@ -70,6 +77,27 @@ def test_io_create_from_matrix_Dense_nd_array(tmp_path, tdb_create_options, src_
         else:
             assert np.array_equal(read_back, src_matrix.toarray())
 
+    if tdb_create_options.consolidate_and_vacuum:
+        assert _fragment_count(tmp_path.as_posix()) == 1
+
+
+def test_io_create_from_matrix_Dense_nd_array_row_exceeds_cap(tmp_path):
+    """Each row is larger than ``remote_cap_nbytes``, so each chunk is one row."""
+    src_matrix = np.arange(1000, dtype=np.float32).reshape((10, 100))
+    tdb_create_options = TileDBCreateOptions(
+        write_X_chunked=True, remote_cap_nbytes=100
+    )
+    somaio.create_from_matrix(
+        soma.DenseNDArray,
+        tmp_path.as_posix(),
+        src_matrix,
+        platform_config={"tiledb": {"create": tdb_create_options}},
+    ).close()
+    assert _fragment_count(tmp_path.as_posix()) == src_matrix.shape[0]
+    with _factory.open(tmp_path.as_posix()) as dnda:
+        read_back = dnda.read((slice(None), slice(None))).to_numpy()
+        assert np.array_equal(read_back, src_matrix)
+
 
 @pytest.mark.parametrize(
     "tdb_create_options",
@@ -78,6 +106,9 @@ def test_io_create_from_matrix_Dense_nd_array(tmp_path, tdb_create_options, src_
         TileDBCreateOptions(write_X_chunked=False, goal_chunk_nnz=100000),
         TileDBCreateOptions(write_X_chunked=True, goal_chunk_nnz=10000),
         TileDBCreateOptions(write_X_chunked=True, goal_chunk_nnz=100000),
+        TileDBCreateOptions(
+            write_X_chunked=True, goal_chunk_nnz=10000, consolidate_and_vacuum=True
+        ),
     ],
 )
 @pytest.mark.parametrize(
@@ -130,6 +161,71 @@ def test_io_create_from_matrix_Sparse_nd_array(
         # fast equality check using __ne__
         assert (sp.csr_matrix(src_matrix) != read_back).nnz == 0
 
+    if tdb_create_options.consolidate_and_vacuum:
+        # An all-empty source matrix writes no fragments at all.
+        assert _fragment_count(tmp_path.as_posix()) <= 1
+
+
+def _fragment_count(array_uri):
+    return len(tiledb.fragment.FragmentInfoList(array_uri=array_uri))
+
+
+@pytest.mark.parametrize(
+    "src_matrix", [("csr", (1001, 899), 0.3), ("dense", (1103, 107), 1)], indirect=True
+)
+def test_io_create_from_matrix_consolidate_resume(tmp_path, src_matrix):
+    cls = (
+        soma.DenseNDArray if isinstance(src_matrix, np.ndarray) else soma.SparseNDArray
+    )
+    chunked = TileDBCreateOptions(write_X_chunked=True, goal_chunk_nnz=1000)
+    consolidated = TileDBCreateOptions(
+        write_X_chunked=True, goal_chunk_nnz=1000, consolidate_and_vacuum=True
+    )
+
+    # Without consolidation, chunked ingest leaves one fragment per chunk.
+    unconsolidated_uri = (tmp_path / "unconsolidated").as_posix()
+    somaio.create_from_matrix(
+        cls,
+        unconsolidated_uri,
+        src_matrix,
+        platform_config={"tiledb": {"create": chunked}},
+    ).close()
+    assert _fragment_count(unconsolidated_uri) > 1
+
+    uri = (tmp_path / "consolidated").as_posix()
+    somaio.create_from_matrix(
+        cls, uri, src_matrix, platform_config={"tiledb": {"create": consolidated}}
+    ).close()
+    assert _fragment_count(uri) == 1
+
+    # A resumed ingest skips every chunk, and consolidating must not break it.
+    somaio.create_from_matrix(
+        cls,
+        uri,
+        src_matrix,
+        platform_config={"tiledb": {"create": consolidated}},
+        ingest_mode="resume",
+    ).close()
+    assert _fragment_count(uri) == 1
+
+    with _factory.open(uri) as arr:
+        if cls is soma.DenseNDArray:
+            read_back = arr.read((slice(None), slice(None))).to_numpy()
+            assert np.array_equal(read_back, src_matrix)
+        else:
+            tbl = arr.read((slice(None), slice(None))).tables().concat()
+            read_back = sp.csr_matrix(
+                (
+                    tbl.column("soma_data").to_numpy(),
+                    (
+                        tbl.column("soma_dim_0").to_numpy(),
+                        tbl.column("soma_dim_1").to_numpy(),
+                    ),
+                ),
+                shape=src_matrix.shape,
+            )
+            assert (sp.csr_matrix(src_matrix) != read_back).nnz == 0
+
 
 @pytest.mark.parametrize(
     "num_rows",
@@ -208,3 +304,58 @@ def test_add_matrices(tmp_path, conftest_pbmc_small_h5ad_path):
             matrix_name="logcounts_pcs",
             matrix_data=new_PCs,
         )
+
+
+def _reference_sparse_chunk_size(matrix, start_index, axis, goal_chunk_nnz):
+    """Row-at-a-time version of ``_find_sparse_chunk_size_non_backed``."""
+    chunk_size = 0
+    sum_nnz = 0
+    coords = [slice(None), slice(None)]
+    for index in range(start_index, matrix.shape[axis]):
+        coords[axis] = index
+        sum_nnz += matrix[tuple(coords)].nnz
+        if sum_nnz > goal_chunk_nnz:
+            break
+        chunk_size += 1
+    return chunk_size
+
+
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("goal_chunk_nnz", [1, 7, 50, 10_000])
+def test_find_sparse_chunk_size_non_backed(fmt, axis, goal_chunk_nnz):
+    matrix = sp.random(40, 30, density=0.2, format=fmt, random_state=0)
+    mean_nnz = ingest._find_mean_nnz(matrix, axis)
+    for start_index in range(matrix.shape[axis] + 1):
+        assert ingest._find_sparse_chunk_size_non_backed(
+            matrix, start_index, axis, goal_chunk_nnz, mean_nnz
+        ) == _reference_sparse_chunk_size(matrix, start_index, axis, goal_chunk_nnz)
+
+
+@pytest.mark.parametrize("fmt", ["csr", "csc"])
+@pytest.mark.parametrize("axis", [0, 1])
+def test_find_sparse_chunk_size_non_backed_oversized_row(fmt, axis):
+    # A single row (or column) holding more than the goal nnz fits no chunk.
+    dense = np.zeros((5, 5))
+    dense[2, :] = 1
+    dense[:, 2] = 1
+    matrix = sp.csr_matrix(dense) if fmt == "csr" else sp.csc_matrix(dense)
+    mean_nnz = ingest._find_mean_nnz(matrix, axis)
+    assert ingest._find_sparse_chunk_size_non_backed(matrix, 2, axis, 4, mean_nnz) == 0
+    assert _reference_sparse_chunk_size(matrix, 2, axis, 4) == 0
+
+
+def test_find_sparse_chunk_size_non_backed_int32_indptr():
+    # indptr[start_index] + goal_chunk_nnz exceeds the int32 range, which must
+    # not wrap around. Only the fields the function reads are provided, so no
+    # 2-billion-nnz matrix is allocated.
+    matrix = types.SimpleNamespace(
+        format="csr",
+        shape=(3, 10),
+        indptr=np.array(
+            [0, 2_000_000_000, 2_100_000_000, 2_147_000_000], dtype=np.int32
+        ),
+    )
+    assert (
+        ingest._find_sparse_chunk_size_non_backed(matrix, 1, 0, 1_000_000_000, 0) == 2
+    )
@@ -1180,6 +1180,22 @@ def test_append_registration_with_nonexistent_storage(tmp_path):
         )
 
 
+def test_append_registration_with_non_experiment_storage(tmp_path):
+    anndata2 = create_anndata_canned(2, "obs_id", "var_id")
+    soma_uri = tmp_path.as_posix()
+
+    tiledbsoma.Collection.create(soma_uri).close()
+
+    with pytest.raises(ValueError, match="cannot find experiment"):
+        tiledbsoma.io.register_anndatas(
+            soma_uri,
+            [anndata2],
+            measurement_name="RNA",
+            obs_field_name="obs_id",
+            var_field_name="var_id",
+        )
+
+
 @pytest.mark.parametrize("obs_field_name", ["obs_id", "cell_id"])
 @pytest.mark.parametrize("var_field_name", ["var_id", "gene_id"])
 @pytest.mark.parametrize(